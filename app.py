@@ -6,19 +6,26 @@ import sys
 import os
 import logging
 import json
+import threading
+import time
 from datetime import datetime
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, render_template, jsonify, request
+import orjson
+import pandas as pd
+from flask import Flask, render_template, jsonify, request, Response
+from flask.json.provider import JSONProvider
 from apscheduler.schedulers.background import BackgroundScheduler
 
 import config
 from logging.handlers import RotatingFileHandler
 from core import database, indicators, predictor, signals, alerts
-from services.market_service import get_latest_price, get_history_df, refresh_watchlist, update_history
-from providers.market_yahoo import get_ticker_info  
+from services.market_service import (
+    get_latest_price, get_history_df, refresh_watchlist, update_history,
+    get_ticker_info, get_ticker_profile,
+)
 from services.sentiment_service import get_sentiment_score
 
 # ── Logging ─────────────────────────────────────────────
@@ -32,10 +39,30 @@ logging.basicConfig(
     ]
 )
 log = logging.getLogger("finedge")
+# Werkzeug logs every request at INFO — measurable overhead under
+# dashboard polling and noise in the rotating log.
+logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+# Process start markers: formatted once, deltas via monotonic clock
+START_TIME = datetime.now().isoformat()
+_START_MONO = time.monotonic()
+
+class OrjsonProvider(JSONProvider):
+    """orjson-backed JSON provider: jsonify serializes in one C call and
+    NumPy scalars/datetimes encode natively, no key sorting."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 # ── Flask App ───────────────────────────────────────────
 app = Flask(__name__, static_folder="static", template_folder="templates")
-app.config["JSON_SORT_KEYS"] = False
+app.json = OrjsonProvider(app)
 
 # ── Scheduler ───────────────────────────────────────────
 scheduler = BackgroundScheduler(daemon=True)
@@ -88,10 +115,14 @@ def api_add_watchlist():
     if not ticker:
         return jsonify({"error": "Ticker required"}), 400
 
-    # Fetch info and add
+    # Fetch info and add; the profile is fetched synchronously here —
+    # fast_info only carries the symbol, and the persisted watchlist
+    # name is what the dashboard displays forever after
     info = get_ticker_info(ticker)
+    profile = get_ticker_profile(ticker)
+    name = profile.get("name") or info.get("name", ticker)
     asset_type = "crypto" if "-USD" in ticker else "stock"
-    database.add_to_watchlist(ticker, info.get("name", ticker), asset_type)
+    database.add_to_watchlist(ticker, name, asset_type)
 
     # Fetch historical data in background
     update_history(ticker, period=config.HISTORY_PERIOD, interval="1d")
@@ -121,7 +152,16 @@ def api_get_price(ticker):
 def api_get_history(ticker):
     days = request.args.get("days", 90, type=int)
     prices = database.get_prices(ticker.upper(), limit=days)
-    return jsonify(prices)
+
+    # Stream row-by-row: peak memory is one serialized row, not the
+    # whole year of bars plus its JSON string.
+    def generate():
+        yield b"["
+        for i, row in enumerate(prices):
+            yield (b"," if i else b"") + orjson.dumps(row)
+        yield b"]"
+
+    return Response(generate(), mimetype="application/json")
 
 
 @app.route("/api/indicators/<ticker>")
@@ -129,15 +169,10 @@ def api_get_indicators(ticker):
     df = get_history_df(ticker.upper(), days=365)
     if df.empty:
         return jsonify({"error": "No data"}), 404
-    df = indicators.compute_all(df)
-    last = df.iloc[-1]
-    result = {}
-    for col in df.columns:
-        val = last[col]
-        if hasattr(val, "item"):
-            result[col] = round(val.item(), 4)
-        elif isinstance(val, (int, float)):
-            result[col] = round(val, 4)
+    df = indicators.compute_all_cached(df, ticker.upper())
+    # One vectorized cast/round instead of per-column type introspection
+    last = df.iloc[-1].astype(float).round(4)
+    result = {k: (None if pd.isna(v) else v) for k, v in last.to_dict().items()}
     return jsonify(result)
 
 
@@ -162,7 +197,9 @@ def api_signal(ticker):
 @app.route("/api/signals")
 def api_all_signals():
     result = signals.generate_all_signals()
-    return jsonify(result)
+    # Through the provider, not raw orjson.dumps: the payload carries
+    # np.float64 scores and needs OPT_SERIALIZE_NUMPY.
+    return Response(app.json.dumps(result), mimetype="application/json")
 
 
 @app.route("/api/signals/latest")
@@ -215,13 +252,15 @@ def api_retrain():
 
 @app.route("/api/dashboard")
 def api_dashboard():
-    return jsonify(signals.get_dashboard_data())
+    return Response(app.json.dumps(signals.get_dashboard_data()),
+                    mimetype="application/json")
 
 
 @app.route("/api/refresh", methods=["POST"])
 def api_refresh():
     """Manually trigger a full refresh."""
-    log.info("Manual refresh triggered")
+    if log.isEnabledFor(logging.INFO):
+        log.info("Manual refresh triggered")
     refresh_watchlist(mode="full")  
     result = signals.generate_all_signals()
     return jsonify({"status": "ok", "signals": len(result)})
@@ -234,7 +273,8 @@ def api_status():
         "status": "running",
         "version": "1.0.0",
         "watchlist_count": len(watchlist),
-        "uptime": datetime.now().isoformat(),
+        "start_time": START_TIME,
+        "uptime_s": round(time.monotonic() - _START_MONO, 1),
         "scheduler_running": scheduler.running,
         "fetch_interval_min": config.FETCH_INTERVAL_MIN,
         "retrain_hours": config.RETRAIN_HOURS,
@@ -250,6 +290,7 @@ def initialize():
     os.makedirs(config.DATA_DIR, exist_ok=True)
     os.makedirs(config.MODELS_DIR, exist_ok=True)
     database.init_db()
+    indicators.prewarm_jit()
 
     # Add default watchlist if empty
     watchlist = database.get_watchlist()
@@ -268,16 +309,23 @@ if __name__ == "__main__":
 
     initialize()
 
-    # Start scheduler
+    # Start scheduler; the startup thread below covers the immediate
+    # fetch, so the interval jobs keep their default first run one full
+    # interval out. misfire_grace_time lets delayed jobs (common when
+    # the Pi is swapping) still execute.
     scheduler.add_job(scheduled_update, "interval",
-                      minutes=config.FETCH_INTERVAL_MIN, id="update")
+                      minutes=config.FETCH_INTERVAL_MIN, id="update",
+                      misfire_grace_time=60)
     scheduler.add_job(scheduled_retrain, "interval",
-                      hours=config.RETRAIN_HOURS, id="retrain")
+                      hours=config.RETRAIN_HOURS, id="retrain",
+                      misfire_grace_time=60)
     scheduler.start()
     log.info(f"Scheduler started: updates every {config.FETCH_INTERVAL_MIN}min, "
              f"retrain every {config.RETRAIN_HOURS}h")
 
-    # Run initial data fetch
+    # Run initial data fetch in the background so the webserver answers
+    # immediately while data populates.
     log.info("Running initial data fetch (this may take a minute)...")
+    threading.Thread(target=scheduled_update, daemon=True).start()
 
     app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG, threaded=True)
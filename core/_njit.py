@@ -0,0 +1,31 @@
+"""
+Optional Numba acceleration layer.
+
+Exposes `njit`: the real `numba.njit` when numba is installed, otherwise
+an identity decorator so jitted kernels degrade to plain Python/NumPy.
+Callers can branch on NUMBA_AVAILABLE to pick a vectorized fallback
+where the plain-Python kernel would be too slow.
+
+Compiled kernels are cached on disk under DATA_DIR so restarts skip
+recompilation.
+"""
+import os
+
+import config
+
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(config.DATA_DIR, "_numba_cache"))
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Identity decorator stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
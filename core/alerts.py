@@ -3,12 +3,18 @@ FinEdge - Telegram Alert System
 Sends trading signals and alerts via Telegram bot.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 import config
 
 log = logging.getLogger("finedge.alerts")
 
+# Keep-alive session: every alert reuses the TLS connection to
+# api.telegram.org instead of paying a fresh handshake per message.
+_SESSION = requests.Session()
+
 
 def send_telegram(message):
     """Send a message via Telegram bot."""
@@ -26,7 +32,7 @@ def send_telegram(message):
         "disable_web_page_preview": True,
     }
     try:
-        resp = requests.post(url, json=payload, timeout=10)
+        resp = _SESSION.post(url, json=payload, timeout=10)
         if resp.status_code == 200:
             log.info("Telegram alert sent")
             return True
@@ -84,6 +90,14 @@ def alert_signal(signal_data):
 
 
 def alert_all_signals(signals):
-    """Send alerts for all significant signals."""
-    for sig in signals:
-        alert_signal(sig)
+    """Send alerts for all significant signals.
+
+    POSTs go out through a small thread pool so a batch of alerts
+    overlaps its network waits instead of blocking the update cycle
+    one message at a time.
+    """
+    if not signals:
+        return
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        for _ in ex.map(alert_signal, signals):
+            pass
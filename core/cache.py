@@ -0,0 +1,43 @@
+"""
+FinEdge - In-Memory TTL Cache
+Small TTL + LRU decorator for hot read paths (DB lookups, sentiment).
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+
+def ttl_cache(seconds, maxsize=128):
+    """Cache a function's results for `seconds`, evicting LRU entries
+    beyond `maxsize`. Thread-safe; exposes `.cache_clear()` on the
+    wrapped function for invalidation after writes.
+    """
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and now < hit[0]:
+                    cache.move_to_end(key)
+                    return hit[1]
+            result = fn(*args, **kwargs)
+            with lock:
+                cache[key] = (now + seconds, result)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
@@ -4,34 +4,119 @@ SQLite-based storage for market data, predictions, and signals.
 """
 import sqlite3
 import json
+import queue
 import threading
 from datetime import datetime
 from contextlib import contextmanager
+from itertools import repeat
 
-import config
-
-_local = threading.local()
-
+import numpy as np
+import pandas as pd
 
-def get_connection():
-    """Get thread-local database connection."""
-    if not hasattr(_local, "conn") or _local.conn is None:
-        _local.conn = sqlite3.connect(config.DB_PATH, check_same_thread=False)
-        _local.conn.row_factory = sqlite3.Row
-        _local.conn.execute("PRAGMA journal_mode=WAL")
-        _local.conn.execute("PRAGMA synchronous=NORMAL")
-    return _local.conn
+import config
+from core.cache import ttl_cache
+
+# Bounded connection pool. The old threading.local approach leaked one
+# connection (WAL reader slot + mmap mapping) per worker thread Flask
+# ever spawned; the pool caps memory and file descriptors at _POOL_MAX
+# connections created lazily on demand.
+_POOL_MAX = 8
+_pool = queue.Queue(maxsize=_POOL_MAX)
+_pool_lock = threading.Lock()
+_pool_size = 0
+
+# Hot-path SQL hoisted to module constants: the interned string objects
+# make sqlite3's prepared-statement LRU hit on identity, skipping reparse.
+_SQL_SAVE_PRICES = """
+    INSERT OR REPLACE INTO price_history
+    (ticker, date, open, high, low, close, volume, adj_close)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_PRICES = "SELECT * FROM price_history WHERE ticker = ? ORDER BY date DESC LIMIT ?"
+_SQL_GET_PRICES_DF = """
+    SELECT * FROM (
+        SELECT date, open AS Open, high AS High, low AS Low,
+               close AS Close, volume AS Volume, adj_close AS "Adj Close"
+        FROM price_history WHERE ticker = ? ORDER BY date DESC LIMIT ?
+    ) ORDER BY date ASC
+"""
+_SQL_SAVE_PREDICTION = """
+    INSERT INTO predictions
+    (ticker, prediction_date, predicted_direction, confidence, predicted_change_pct, model_version)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_SAVE_SIGNAL = """
+    INSERT INTO signals
+    (ticker, signal_type, edge_score, ml_score, ta_score, sentiment_score, details)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_LATEST_SIGNALS = """
+    SELECT id, ticker, created_at, signal_type, edge_score,
+           ml_score, ta_score, sentiment_score, details
+    FROM (
+        SELECT *, ROW_NUMBER() OVER (
+            PARTITION BY ticker ORDER BY created_at DESC
+        ) AS rn FROM signals
+    ) WHERE rn = 1
+    ORDER BY edge_score DESC
+"""
+_SQL_GET_SIGNAL_HISTORY = "SELECT * FROM signals WHERE ticker = ? ORDER BY created_at DESC LIMIT ?"
+
+
+def _make_connection():
+    conn = sqlite3.connect(
+        config.DB_PATH, check_same_thread=False, cached_statements=512
+    )
+    conn.row_factory = sqlite3.Row
+    conn.set_trace_callback(None)
+    conn.execute("PRAGMA page_size=4096")  # takes effect before first write
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")  # 128MB mmap
+    conn.execute("PRAGMA cache_size=-20000")    # 20MB page cache
+    return conn
+
+
+def _acquire_connection():
+    global _pool_size
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        pass
+    with _pool_lock:
+        if _pool_size < _POOL_MAX:
+            _pool_size += 1
+            return _make_connection()
+    # Pool exhausted: block until another thread returns one
+    return _pool.get()
+
+
+def reset_pool():
+    """Discard inherited pool state; run as a fork initializer.
+
+    SQLite forbids using a connection across fork() — the child shares
+    the parent's file descriptor and lock state. Worker processes
+    (predictor.retrain_all) call this first so they drop any inherited
+    connections and lazily open their own.
+    """
+    global _pool, _pool_lock, _pool_size
+    _pool = queue.Queue(maxsize=_POOL_MAX)
+    _pool_lock = threading.Lock()
+    _pool_size = 0
 
 
 @contextmanager
 def get_db():
-    conn = get_connection()
+    conn = _acquire_connection()
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
+    finally:
+        _pool.put(conn)
 
 
 def init_db():
@@ -104,6 +189,10 @@ def init_db():
             CREATE INDEX IF NOT EXISTS idx_price_ticker_date ON price_history(ticker, date);
             CREATE INDEX IF NOT EXISTS idx_pred_ticker ON predictions(ticker, created_at);
             CREATE INDEX IF NOT EXISTS idx_signal_ticker ON signals(ticker, created_at);
+
+            -- Dropped: idx_signal_ticker(ticker, created_at) already
+            -- serves the latest-signals window via a reverse scan.
+            DROP INDEX IF EXISTS idx_signal_ticker_created_desc;
         """)
 
 
@@ -131,47 +220,73 @@ def remove_from_watchlist(ticker):
 # ── Price History ───────────────────────────────────────────
 
 def save_prices(ticker, df):
-    """Save a pandas DataFrame of OHLCV data (bulk insert)."""
+    """Save a pandas DataFrame of OHLCV data (bulk insert).
+
+    Converts the frame column-wise instead of row-by-row so the only
+    per-row work is a single zip, then hands all rows to SQLite in one
+    executemany/transaction.
+    """
     if df.empty:
         return
     ticker_upper = ticker.upper()
-    rows = []
-    for idx, row in df.iterrows():
-        date_str = idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx)
-        rows.append((
-            ticker_upper, date_str,
-            float(row.get("Open", 0)), float(row.get("High", 0)),
-            float(row.get("Low", 0)), float(row.get("Close", 0)),
-            int(row.get("Volume", 0)),
-            float(row.get("Adj Close", row.get("Close", 0)))
-        ))
+    if hasattr(df.index, "strftime"):
+        dates = df.index.strftime("%Y-%m-%d")
+    else:
+        dates = [str(idx) for idx in df.index]
+    # SoA extraction: each column leaves pandas exactly once as a
+    # contiguous ndarray; zip then walks the buffers without creating
+    # intermediate lists. np.float64 binds directly in sqlite3 (float
+    # subclass); volume goes through tolist() for plain ints.
+    o = df["Open"].to_numpy(dtype=np.float64)
+    h = df["High"].to_numpy(dtype=np.float64)
+    lo = df["Low"].to_numpy(dtype=np.float64)
+    c = df["Close"].to_numpy(dtype=np.float64)
+    v = df["Volume"].fillna(0).to_numpy(dtype=np.int64).tolist()
+    ac = df["Adj Close"].to_numpy(dtype=np.float64) if "Adj Close" in df.columns else c
+    rows = list(zip(repeat(ticker_upper), dates, o, h, lo, c, v, ac))
     with get_db() as db:
-        db.executemany("""
-            INSERT OR REPLACE INTO price_history
-            (ticker, date, open, high, low, close, volume, adj_close)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, rows)
+        db.executemany(_SQL_SAVE_PRICES, rows)
 
 
 def get_prices(ticker, limit=365):
     with get_db() as db:
-        rows = db.execute(
-            "SELECT * FROM price_history WHERE ticker = ? ORDER BY date DESC LIMIT ?",
-            (ticker.upper(), limit)
-        ).fetchall()
+        rows = db.execute(_SQL_GET_PRICES, (ticker.upper(), limit)).fetchall()
         return [dict(r) for r in reversed(rows)]
 
 
+def get_last_date(ticker):
+    """Latest stored bar date for a ticker ('YYYY-MM-DD'), or None."""
+    with get_db() as db:
+        row = db.execute(
+            "SELECT MAX(date) AS last_date FROM price_history WHERE ticker = ?",
+            (ticker.upper(),)
+        ).fetchone()
+        return row["last_date"] if row else None
+
+
+def get_prices_df(ticker, limit=365):
+    """Read price history straight into a DataFrame via pd.read_sql_query.
+
+    Rows land in NumPy buffers through the sqlite3 C adapter — no
+    dict-per-row materialization, no reversal, no rename pass. Columns
+    come back already in the Open/High/... shape the indicator pipeline
+    expects. Keeps the latest `limit` rows, oldest first.
+    """
+    with get_db() as db:
+        return pd.read_sql_query(
+            _SQL_GET_PRICES_DF, db, params=(ticker.upper(), limit),
+            parse_dates=["date"], index_col="date",
+        )
+
+
 # ── Predictions ─────────────────────────────────────────────
 
 def save_prediction(ticker, direction, confidence, change_pct, model_version="v1"):
     with get_db() as db:
         pred_date = datetime.now().strftime("%Y-%m-%d")
-        db.execute("""
-            INSERT INTO predictions
-            (ticker, prediction_date, predicted_direction, confidence, predicted_change_pct, model_version)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (ticker.upper(), pred_date, direction, confidence, change_pct, model_version))
+        db.execute(_SQL_SAVE_PREDICTION,
+                   (ticker.upper(), pred_date, direction, confidence, change_pct, model_version))
+    get_prediction_accuracy.cache_clear()
 
 
 def get_predictions(ticker, limit=30):
@@ -183,6 +298,7 @@ def get_predictions(ticker, limit=30):
         return [dict(r) for r in rows]
 
 
+@ttl_cache(seconds=60)
 def get_prediction_accuracy(ticker):
     with get_db() as db:
         row = db.execute("""
@@ -202,33 +318,41 @@ def get_prediction_accuracy(ticker):
 
 def save_signal(ticker, signal_type, edge_score, ml_score, ta_score, sentiment_score, details=None):
     with get_db() as db:
-        db.execute("""
-            INSERT INTO signals
-            (ticker, signal_type, edge_score, ml_score, ta_score, sentiment_score, details)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (ticker.upper(), signal_type, edge_score, ml_score, ta_score,
-              sentiment_score, json.dumps(details or {})))
+        db.execute(_SQL_SAVE_SIGNAL,
+                   (ticker.upper(), signal_type, edge_score, ml_score, ta_score,
+                    sentiment_score, json.dumps(details or {})))
+    get_latest_signals.cache_clear()
+
+
+def save_signals_bulk(rows):
+    """Insert many signals in one transaction.
 
+    `rows` are (ticker, signal_type, edge_score, ml_score, ta_score,
+    sentiment_score, details) tuples — one executemany/commit for the
+    whole batch instead of one WAL fsync per ticker.
+    """
+    if not rows:
+        return
+    with get_db() as db:
+        db.executemany(_SQL_SAVE_SIGNAL, [
+            (t.upper(), st, es, ml, ta, se, json.dumps(d or {}))
+            for (t, st, es, ml, ta, se, d) in rows
+        ])
+    get_latest_signals.cache_clear()
 
+
+@ttl_cache(seconds=5)
 def get_latest_signals():
+    # Window function instead of the max-per-ticker self-join: one
+    # reverse scan over idx_signal_ticker, no per-ticker sort.
     with get_db() as db:
-        rows = db.execute("""
-            SELECT s.* FROM signals s
-            INNER JOIN (
-                SELECT ticker, MAX(created_at) as max_created
-                FROM signals GROUP BY ticker
-            ) latest ON s.ticker = latest.ticker AND s.created_at = latest.max_created
-            ORDER BY s.edge_score DESC
-        """).fetchall()
+        rows = db.execute(_SQL_GET_LATEST_SIGNALS).fetchall()
         return [dict(r) for r in rows]
 
 
 def get_signal_history(ticker, limit=50):
     with get_db() as db:
-        rows = db.execute(
-            "SELECT * FROM signals WHERE ticker = ? ORDER BY created_at DESC LIMIT ?",
-            (ticker.upper(), limit)
-        ).fetchall()
+        rows = db.execute(_SQL_GET_SIGNAL_HISTORY, (ticker.upper(), limit)).fetchall()
         return [dict(r) for r in rows]
 
 
@@ -265,8 +389,10 @@ def save_model_metrics(ticker, accuracy, precision, recall, f1, sample_count):
             (ticker, accuracy, precision_score, recall, f1, sample_count)
             VALUES (?, ?, ?, ?, ?, ?)
         """, (ticker.upper(), accuracy, precision, recall, f1, sample_count))
+    get_model_metrics.cache_clear()
 
 
+@ttl_cache(seconds=60)
 def get_model_metrics(ticker):
     with get_db() as db:
         row = db.execute(
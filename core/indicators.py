@@ -3,13 +3,349 @@ FinEdge - Technical Indicators Engine
 Calculates RSI, MACD, Bollinger Bands, SMA/EMA crossovers, ADX, MFI, and more.
 All computations use pandas/numpy for fast performance.
 """
+import logging
+import threading
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
-import logging
+
+from core._njit import njit, NUMBA_AVAILABLE
 
 log = logging.getLogger("finedge.indicators")
 
 
+@njit(cache=True)
+def _ewm_mean_nb(x, alpha):
+    """Exponentially weighted mean, adjust=False recurrence."""
+    out = np.empty_like(x)
+    out[0] = x[0]
+    for i in range(1, x.shape[0]):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+def _ema(series, span):
+    """EMA via the jitted recurrence when numba is present, pandas otherwise."""
+    if NUMBA_AVAILABLE:
+        alpha = 2.0 / (span + 1.0)
+        return pd.Series(_ewm_mean_nb(series.to_numpy(dtype=np.float64), alpha),
+                         index=series.index)
+    return series.ewm(span=span, adjust=False).mean()
+
+
+@njit(cache=True)
+def _rolling_mad_nb(x, w):
+    """Rolling mean absolute deviation around each window's own mean."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(w - 1, n):
+        s = 0.0
+        for j in range(i - w + 1, i + 1):
+            s += x[j]
+        m = s / w
+        dev = 0.0
+        for j in range(i - w + 1, i + 1):
+            dev += abs(x[j] - m)
+        out[i] = dev / w
+    return out
+
+
+def _rolling_mad(x, w):
+    if NUMBA_AVAILABLE:
+        return _rolling_mad_nb(x, w)
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] >= w:
+        win = np.lib.stride_tricks.sliding_window_view(x, w)
+        out[w - 1:] = np.abs(win - win.mean(axis=1, keepdims=True)).mean(axis=1)
+    return out
+
+
+def prewarm_jit():
+    """Compile the numba kernels once at startup so the first request
+    doesn't pay JIT latency."""
+    if not NUMBA_AVAILABLE:
+        return
+    x = np.linspace(1.0, 2.0, 32)
+    _ewm_mean_nb(x, 0.5)
+    _obv_nb(x, x)
+    _rolling_mad_nb(x, 4)
+    _compute_all_kernel(x, x, x, x)
+
+
+# Column order of the fused kernel's output matrix
+_KERNEL_COLS = [
+    "SMA_10", "SMA_20", "SMA_50", "EMA_12", "EMA_26", "EMA_9",
+    "MACD", "MACD_Signal", "MACD_Hist", "RSI",
+    "BB_Upper", "BB_Middle", "BB_Lower", "BB_Width", "BB_Pct",
+    "ATR", "Stoch_K", "Stoch_D", "Volume_SMA_20", "Volume_Ratio",
+    "OBV", "ROC_5", "ROC_10", "ROC_20", "Momentum_10",
+    "SMA_Cross_10_20", "SMA_Cross_20_50", "VWAP", "Williams_R",
+    "CCI", "ADX", "MFI",
+]
+
+
+@njit(cache=True, error_model="numpy")
+def _compute_all_kernel(h, l, c, v):
+    """Fused indicator pass: walks the OHLCV arrays once, keeping
+    rolling sums and EWM state in scalars, and fills an (n, 32) matrix
+    in _KERNEL_COLS order. Semantics mirror the pandas fallback,
+    including where leading values stay NaN; error_model="numpy" keeps
+    zero divisions (flat ranges, zero volume, lossless RSI windows)
+    yielding inf/nan instead of raising like the Python error model."""
+    n = c.shape[0]
+    out = np.full((n, 32), np.nan)
+
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+    a14 = 1.0 / 14.0
+
+    csum10 = 0.0
+    csum20 = 0.0
+    csumsq20 = 0.0
+    csum50 = 0.0
+    vsum20 = 0.0
+    trsum14 = 0.0
+    tpsum20 = 0.0
+    possum14 = 0.0
+    negsum14 = 0.0
+    e12 = 0.0
+    e26 = 0.0
+    e9 = 0.0
+    esig = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    pewm = 0.0
+    mewm = 0.0
+    aewm = 0.0
+    dx_count = 0
+    obv = 0.0
+    tpv_cum = 0.0
+    v_cum = 0.0
+
+    tr_buf = np.empty(n)
+    tp_buf = np.empty(n)
+    k_buf = np.full(n, np.nan)
+    pos_buf = np.empty(n)
+    neg_buf = np.empty(n)
+
+    for i in range(n):
+        ci = c[i]
+        hi = h[i]
+        li = l[i]
+        vi = v[i]
+
+        # Rolling sums (O(1) updates)
+        csum10 += ci
+        if i >= 10:
+            csum10 -= c[i - 10]
+        csum20 += ci
+        csumsq20 += ci * ci
+        if i >= 20:
+            csum20 -= c[i - 20]
+            csumsq20 -= c[i - 20] * c[i - 20]
+        csum50 += ci
+        if i >= 50:
+            csum50 -= c[i - 50]
+        vsum20 += vi
+        if i >= 20:
+            vsum20 -= v[i - 20]
+
+        sma10 = np.nan
+        sma20 = np.nan
+        sma50 = np.nan
+        if i >= 9:
+            sma10 = csum10 / 10.0
+            out[i, 0] = sma10
+        if i >= 19:
+            sma20 = csum20 / 20.0
+            out[i, 1] = sma20
+        if i >= 49:
+            sma50 = csum50 / 50.0
+            out[i, 2] = sma50
+
+        # EMAs (adjust=False recurrences)
+        if i == 0:
+            e12 = ci
+            e26 = ci
+            e9 = ci
+        else:
+            e12 = a12 * ci + (1.0 - a12) * e12
+            e26 = a26 * ci + (1.0 - a26) * e26
+            e9 = a9 * ci + (1.0 - a9) * e9
+        out[i, 3] = e12
+        out[i, 4] = e26
+        out[i, 5] = e9
+
+        # MACD
+        macd = e12 - e26
+        if i == 0:
+            esig = macd
+        else:
+            esig = a9 * macd + (1.0 - a9) * esig
+        out[i, 6] = macd
+        out[i, 7] = esig
+        out[i, 8] = macd - esig
+
+        # RSI (Wilder EWM, min_periods=14). The pandas path's .where
+        # turns the NaN first diff into gain[0] = 0.0, so the adjust=
+        # False recurrence is seeded from zero — avg_gain/avg_loss
+        # start at 0.0 above — and the first emitted index is 13.
+        if i >= 1:
+            delta = ci - c[i - 1]
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+            avg_gain = (1.0 - a14) * avg_gain + a14 * gain
+            avg_loss = (1.0 - a14) * avg_loss + a14 * loss
+            if i >= 13:
+                out[i, 9] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        # Bollinger (20, 2 std, ddof=1)
+        if i >= 19:
+            var = (csumsq20 - csum20 * csum20 / 20.0) / 19.0
+            if var < 0.0:
+                var = 0.0
+            std = np.sqrt(var)
+            upper = sma20 + 2.0 * std
+            lower = sma20 - 2.0 * std
+            out[i, 10] = upper
+            out[i, 11] = sma20
+            out[i, 12] = lower
+            out[i, 13] = (upper - lower) / sma20 * 100.0
+            out[i, 14] = (ci - lower) / (upper - lower)
+
+        # ATR (rolling 14 mean of true range)
+        tr = hi - li
+        if i >= 1:
+            t2 = abs(hi - c[i - 1])
+            if t2 > tr:
+                tr = t2
+            t3 = abs(li - c[i - 1])
+            if t3 > tr:
+                tr = t3
+        tr_buf[i] = tr
+        trsum14 += tr
+        if i >= 14:
+            trsum14 -= tr_buf[i - 14]
+        atr = np.nan
+        if i >= 13:
+            atr = trsum14 / 14.0
+            out[i, 15] = atr
+
+        # Stochastic (14, 3) + Williams %R
+        if i >= 13:
+            lo14 = li
+            hi14 = hi
+            for j in range(i - 13, i + 1):
+                if l[j] < lo14:
+                    lo14 = l[j]
+                if h[j] > hi14:
+                    hi14 = h[j]
+            rng = hi14 - lo14
+            k = (ci - lo14) / rng * 100.0
+            k_buf[i] = k
+            out[i, 16] = k
+            out[i, 28] = (hi14 - ci) / rng * -100.0
+            if i >= 15:
+                out[i, 17] = (k_buf[i] + k_buf[i - 1] + k_buf[i - 2]) / 3.0
+
+        # Volume SMA / ratio
+        if i >= 19:
+            vsma = vsum20 / 20.0
+            out[i, 18] = vsma
+            out[i, 19] = vi / vsma
+
+        # OBV
+        if i >= 1:
+            if ci > c[i - 1]:
+                obv += vi
+            elif ci < c[i - 1]:
+                obv -= vi
+        out[i, 20] = obv
+
+        # ROC / Momentum
+        if i >= 5:
+            out[i, 21] = (ci / c[i - 5] - 1.0) * 100.0
+        if i >= 10:
+            out[i, 22] = (ci / c[i - 10] - 1.0) * 100.0
+            out[i, 24] = ci - c[i - 10]
+        if i >= 20:
+            out[i, 23] = (ci / c[i - 20] - 1.0) * 100.0
+
+        # SMA crossovers (NaN comparisons fail -> -1, like np.where)
+        out[i, 25] = 1.0 if (i >= 19 and sma10 > sma20) else -1.0
+        out[i, 26] = 1.0 if (i >= 49 and sma20 > sma50) else -1.0
+
+        # VWAP
+        tp = (hi + li + ci) / 3.0
+        tp_buf[i] = tp
+        tpv_cum += tp * vi
+        v_cum += vi
+        out[i, 27] = tpv_cum / v_cum
+
+        # CCI (20) — windowed MAD around the window mean
+        tpsum20 += tp
+        if i >= 20:
+            tpsum20 -= tp_buf[i - 20]
+        if i >= 19:
+            tpm = tpsum20 / 20.0
+            mad = 0.0
+            for j in range(i - 19, i + 1):
+                mad += abs(tp_buf[j] - tpm)
+            mad /= 20.0
+            out[i, 29] = (tp - tpm) / (0.015 * mad)
+
+        # ADX (14)
+        pdm = 0.0
+        mdm = 0.0
+        if i >= 1:
+            up = hi - h[i - 1]
+            dn = l[i - 1] - li
+            if up > dn and up > 0.0:
+                pdm = up
+            if dn > up and dn > 0.0:
+                mdm = dn
+        if i == 0:
+            pewm = pdm
+            mewm = mdm
+        else:
+            pewm = (1.0 - a14) * pewm + a14 * pdm
+            mewm = (1.0 - a14) * mewm + a14 * mdm
+        if i >= 13 and not np.isnan(atr):
+            pdi = 100.0 * pewm / atr
+            mdi = 100.0 * mewm / atr
+            dxv = abs(pdi - mdi) / (pdi + mdi) * 100.0
+            if not np.isnan(dxv):
+                if dx_count == 0:
+                    aewm = dxv
+                else:
+                    aewm = (1.0 - a14) * aewm + a14 * dxv
+                dx_count += 1
+                if dx_count >= 14:
+                    out[i, 30] = aewm
+
+        # MFI (14)
+        posmf = 0.0
+        negmf = 0.0
+        if i >= 1:
+            if tp > tp_buf[i - 1]:
+                posmf = tp * vi
+            elif tp < tp_buf[i - 1]:
+                negmf = tp * vi
+        pos_buf[i] = posmf
+        neg_buf[i] = negmf
+        possum14 += posmf
+        negsum14 += negmf
+        if i >= 14:
+            possum14 -= pos_buf[i - 14]
+            negsum14 -= neg_buf[i - 14]
+        if i >= 13 and negsum14 != 0.0:
+            out[i, 31] = 100.0 - 100.0 / (1.0 + possum14 / negsum14)
+
+    return out
+
+
 def compute_all(df):
     """Compute all technical indicators on a price DataFrame.
     Expects columns: Open, High, Low, Close, Volume
@@ -19,83 +355,149 @@ def compute_all(df):
         log.warning("Not enough data for indicators")
         return df
 
-    df = df.copy()
+    if NUMBA_AVAILABLE:
+        out = _compute_all_kernel(
+            df["High"].to_numpy(dtype=np.float64),
+            df["Low"].to_numpy(dtype=np.float64),
+            df["Close"].to_numpy(dtype=np.float64),
+            df["Volume"].to_numpy(dtype=np.float64),
+        )
+        return pd.concat(
+            [df, pd.DataFrame(out, index=df.index, columns=_KERNEL_COLS)],
+            axis=1,
+        )
+
+    return _compute_all_pandas(df)
+
+
+# Memo for compute_all_cached: the frame identity is captured by
+# (ticker, last index entry, row count, last close/volume). The
+# close/volume fingerprint matters intraday — the refresh loop
+# INSERT OR REPLACEs today's bar, which changes neither the date
+# index nor the row count.
+_MEMO_MAX = 64
+_memo_lock = threading.Lock()
+_memo = OrderedDict()
+
+
+def compute_all_cached(df, ticker):
+    """compute_all memoized per ticker and data version.
+
+    A signal cycle and the dashboard/API paths each recompute the full
+    indicator set over the same history; when the underlying bars have
+    not changed, the augmented frame from the last call is returned
+    instead. Callers must treat the result as read-only (they already
+    do — nothing downstream mutates the indicator frame).
+    """
+    if df.empty:
+        return compute_all(df)
+    key = (ticker, df.index[-1], len(df),
+           float(df["Close"].iat[-1]), float(df["Volume"].iat[-1]))
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached is not None:
+            _memo.move_to_end(key)
+            return cached
+    result = compute_all(df)
+    with _memo_lock:
+        _memo[key] = result
+        _memo.move_to_end(key)
+        while len(_memo) > _MEMO_MAX:
+            _memo.popitem(last=False)
+    return result
+
+
+def _compute_all_pandas(df):
+    """Column-by-column pandas implementation; fallback when numba is
+    not installed.
+
+    Indicators accumulate in a plain dict and join the input in one
+    concat at the end — no up-front copy of the OHLCV block and no
+    per-column BlockManager rebuilds.
+    """
     close = df["Close"].astype(float)
     high = df["High"].astype(float)
     low = df["Low"].astype(float)
     volume = df["Volume"].astype(float)
+    new = {}
 
     # ── Moving Averages ─────────────────────────────
-    df["SMA_10"] = close.rolling(10).mean()
-    df["SMA_20"] = close.rolling(20).mean()
-    df["SMA_50"] = close.rolling(50).mean()
-    df["EMA_12"] = close.ewm(span=12, adjust=False).mean()
-    df["EMA_26"] = close.ewm(span=26, adjust=False).mean()
-    df["EMA_9"] = close.ewm(span=9, adjust=False).mean()
+    sma_10 = new["SMA_10"] = close.rolling(10).mean()
+    sma_20 = new["SMA_20"] = close.rolling(20).mean()
+    sma_50 = new["SMA_50"] = close.rolling(50).mean()
+    ema_12 = new["EMA_12"] = _ema(close, 12)
+    ema_26 = new["EMA_26"] = _ema(close, 26)
+    new["EMA_9"] = _ema(close, 9)
 
     # ── MACD ────────────────────────────────────────
-    df["MACD"] = df["EMA_12"] - df["EMA_26"]
-    df["MACD_Signal"] = df["MACD"].ewm(span=9, adjust=False).mean()
-    df["MACD_Hist"] = df["MACD"] - df["MACD_Signal"]
+    macd = new["MACD"] = ema_12 - ema_26
+    macd_signal = new["MACD_Signal"] = _ema(macd, 9)
+    new["MACD_Hist"] = macd - macd_signal
 
     # ── RSI (14-period) ─────────────────────────────
-    df["RSI"] = _compute_rsi(close, 14)
+    new["RSI"] = _compute_rsi(close, 14)
 
     # ── Bollinger Bands (20-period, 2 std) ──────────
-    bb_sma = close.rolling(20).mean()
-    bb_std = close.rolling(20).std()
-    df["BB_Upper"] = bb_sma + (bb_std * 2)
-    df["BB_Middle"] = bb_sma
-    df["BB_Lower"] = bb_sma - (bb_std * 2)
-    df["BB_Width"] = ((df["BB_Upper"] - df["BB_Lower"]) / df["BB_Middle"]) * 100
-    df["BB_Pct"] = (close - df["BB_Lower"]) / (df["BB_Upper"] - df["BB_Lower"])
+    # Raw ndarray math: five temporary Series collapse into plain
+    # array arithmetic on the rolling mean/std buffers.
+    bb_mean = sma_20.to_numpy()
+    bb_std = close.rolling(20).std().to_numpy()
+    c_arr = close.to_numpy()
+    bb_upper = bb_mean + 2 * bb_std
+    bb_lower = bb_mean - 2 * bb_std
+    new["BB_Upper"] = bb_upper
+    new["BB_Middle"] = bb_mean
+    new["BB_Lower"] = bb_lower
+    new["BB_Width"] = (bb_upper - bb_lower) / bb_mean * 100
+    new["BB_Pct"] = (c_arr - bb_lower) / (bb_upper - bb_lower)
 
     # ── ATR (14-period) ─────────────────────────────
-    df["ATR"] = _compute_atr(high, low, close, 14)
+    new["ATR"] = _compute_atr(high, low, close, 14)
 
     # ── Stochastic Oscillator (14, 3) ───────────────
     low_14 = low.rolling(14).min()
     high_14 = high.rolling(14).max()
-    df["Stoch_K"] = ((close - low_14) / (high_14 - low_14)) * 100
-    df["Stoch_D"] = df["Stoch_K"].rolling(3).mean()
+    stoch_k = new["Stoch_K"] = ((close - low_14) / (high_14 - low_14)) * 100
+    new["Stoch_D"] = stoch_k.rolling(3).mean()
 
     # ── Volume indicators ───────────────────────────
-    df["Volume_SMA_20"] = volume.rolling(20).mean()
-    df["Volume_Ratio"] = volume / df["Volume_SMA_20"]
-    df["OBV"] = _compute_obv(close, volume)
+    volume_sma = new["Volume_SMA_20"] = volume.rolling(20).mean()
+    new["Volume_Ratio"] = volume / volume_sma
+    new["OBV"] = _compute_obv(close, volume)
 
     # ── Price Rate of Change (ROC) ──────────────────
-    df["ROC_5"] = close.pct_change(5) * 100
-    df["ROC_10"] = close.pct_change(10) * 100
-    df["ROC_20"] = close.pct_change(20) * 100
+    new["ROC_5"] = close.pct_change(5) * 100
+    new["ROC_10"] = close.pct_change(10) * 100
+    new["ROC_20"] = close.pct_change(20) * 100
 
     # ── Momentum ────────────────────────────────────
-    df["Momentum_10"] = close - close.shift(10)
+    new["Momentum_10"] = close - close.shift(10)
 
     # ── SMA Crossover Signals ───────────────────────
-    df["SMA_Cross_10_20"] = np.where(df["SMA_10"] > df["SMA_20"], 1, -1)
-    df["SMA_Cross_20_50"] = np.where(df["SMA_20"] > df["SMA_50"], 1, -1)
+    new["SMA_Cross_10_20"] = np.where(sma_10 > sma_20, 1, -1)
+    new["SMA_Cross_20_50"] = np.where(sma_20 > sma_50, 1, -1)
 
     # ── VWAP (intraday proxy) ───────────────────────
     tp = (high + low + close) / 3
-    df["VWAP"] = (tp * volume).cumsum() / volume.cumsum()
+    new["VWAP"] = (tp * volume).cumsum() / volume.cumsum()
 
     # ── Williams %R ─────────────────────────────────
-    df["Williams_R"] = ((high_14 - close) / (high_14 - low_14)) * -100
+    new["Williams_R"] = ((high_14 - close) / (high_14 - low_14)) * -100
 
     # ── CCI (20-period) ─────────────────────────────
-    tp = (high + low + close) / 3
+    # Reuses VWAP's typical price; MAD in one windowed pass instead of
+    # a Python lambda per rolling window.
     tp_sma = tp.rolling(20).mean()
-    tp_mad = tp.rolling(20).apply(lambda x: np.abs(x - x.mean()).mean(), raw=True)
-    df["CCI"] = (tp - tp_sma) / (0.015 * tp_mad)
+    tp_mad = _rolling_mad(tp.to_numpy(dtype=np.float64), 20)
+    new["CCI"] = (tp - tp_sma) / (0.015 * tp_mad)
 
     # ── ADX (14-period) ─────────────────────────────
-    df["ADX"] = _compute_adx(high, low, close, 14)
+    new["ADX"] = _compute_adx(high, low, close, 14)
 
     # ── MFI (14-period) ─────────────────────────────
-    df["MFI"] = _compute_mfi(high, low, close, volume, 14)
+    new["MFI"] = _compute_mfi(high, low, close, volume, 14)
 
-    return df
+    return pd.concat([df, pd.DataFrame(new, index=df.index)], axis=1)
 
 
 def _compute_rsi(series, period=14):
@@ -109,17 +511,41 @@ def _compute_rsi(series, period=14):
 
 
 def _compute_atr(high, low, close, period=14):
-    tr1 = high - low
-    tr2 = (high - close.shift()).abs()
-    tr3 = (low - close.shift()).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    return tr.rolling(period).mean()
+    # Elementwise max on the raw arrays; no 3-column frame just to
+    # reduce across rows. np.fmax ignores NaN (the shifted terms on the
+    # first row), matching DataFrame.max(axis=1)'s skipna behaviour.
+    prev_close = close.shift().to_numpy()
+    tr = np.fmax(high.to_numpy() - low.to_numpy(),
+                 np.fmax(np.abs(high.to_numpy() - prev_close),
+                         np.abs(low.to_numpy() - prev_close)))
+    return pd.Series(tr, index=high.index).rolling(period).mean()
+
+
+@njit(cache=True)
+def _obv_nb(c, v):
+    out = np.empty_like(c)
+    out[0] = 0.0
+    for i in range(1, c.shape[0]):
+        if c[i] > c[i - 1]:
+            out[i] = out[i - 1] + v[i]
+        elif c[i] < c[i - 1]:
+            out[i] = out[i - 1] - v[i]
+        else:
+            out[i] = out[i - 1]
+    return out
 
 
 def _compute_obv(close, volume):
-    direction = np.sign(close.diff())
-    obv = (direction * volume).fillna(0).cumsum()
-    return obv
+    # Work on raw ndarrays: jitted running loop with numba, otherwise a
+    # sign/cumsum over the same buffers — no pandas scalar indexing.
+    c = close.to_numpy(dtype=np.float64)
+    v = volume.to_numpy(dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        obv = _obv_nb(c, v)
+    else:
+        delta = np.sign(np.diff(c))
+        obv = np.concatenate(([0.0], np.cumsum(delta * v[1:])))
+    return pd.Series(obv, index=close.index)
 
 
 def _compute_adx(high, low, close, period=14):
@@ -160,44 +586,35 @@ def get_ta_score(df):
     signals = {}
     score_parts = []
 
+    # Each component maps its thresholds through one np.select instead
+    # of an if/elif ladder; NaN readings fall through to the defaults
+    # exactly like the old failed comparisons did.
+
     # RSI Signal
     rsi = last.get("RSI", 50)
-    if rsi < 30:
-        signals["RSI"] = {"value": round(rsi, 1), "signal": "OVERSOLD", "score": 30}
-        score_parts.append(30)
-    elif rsi < 40:
-        signals["RSI"] = {"value": round(rsi, 1), "signal": "BULLISH", "score": 15}
-        score_parts.append(15)
-    elif rsi > 70:
-        signals["RSI"] = {"value": round(rsi, 1), "signal": "OVERBOUGHT", "score": -30}
-        score_parts.append(-30)
-    elif rsi > 60:
-        signals["RSI"] = {"value": round(rsi, 1), "signal": "BEARISH", "score": -15}
-        score_parts.append(-15)
-    else:
-        signals["RSI"] = {"value": round(rsi, 1), "signal": "NEUTRAL", "score": 0}
-        score_parts.append(0)
+    conds = [rsi < 30, rsi < 40, rsi > 70, rsi > 60]
+    score = int(np.select(conds, [30, 15, -30, -15], default=0))
+    label = str(np.select(conds, ["OVERSOLD", "BULLISH", "OVERBOUGHT", "BEARISH"],
+                          default="NEUTRAL"))
+    signals["RSI"] = {"value": round(rsi, 1), "signal": label, "score": score}
+    score_parts.append(score)
 
     # MACD Signal — normalise histogram relative to price
     macd_hist = last.get("MACD_Hist", 0)
     price = last.get("Close", 1)
     macd_pct = (macd_hist / price) * 1000 if price else 0
-    macd_s = max(-25, min(25, macd_pct * 10))
+    macd_s = float(np.clip(macd_pct * 10, -25, 25))
     label = "BULLISH" if macd_hist > 0 else "BEARISH"
     signals["MACD"] = {"value": round(macd_hist, 4), "signal": label, "score": round(macd_s)}
     score_parts.append(macd_s)
 
     # Bollinger Band Position
     bb_pct = last.get("BB_Pct", 0.5)
-    if bb_pct < 0.1:
-        signals["Bollinger"] = {"value": round(bb_pct, 2), "signal": "OVERSOLD", "score": 20}
-        score_parts.append(20)
-    elif bb_pct > 0.9:
-        signals["Bollinger"] = {"value": round(bb_pct, 2), "signal": "OVERBOUGHT", "score": -20}
-        score_parts.append(-20)
-    else:
-        signals["Bollinger"] = {"value": round(bb_pct, 2), "signal": "NEUTRAL", "score": 0}
-        score_parts.append(0)
+    conds = [bb_pct < 0.1, bb_pct > 0.9]
+    score = int(np.select(conds, [20, -20], default=0))
+    label = str(np.select(conds, ["OVERSOLD", "OVERBOUGHT"], default="NEUTRAL"))
+    signals["Bollinger"] = {"value": round(bb_pct, 2), "signal": label, "score": score}
+    score_parts.append(score)
 
     # SMA Crossovers
     sma_cross = last.get("SMA_Cross_10_20", 0)
@@ -210,53 +627,37 @@ def get_ta_score(df):
 
     # Volume
     vol_ratio = last.get("Volume_Ratio", 1.0)
-    if vol_ratio > 2.0:
-        signals["Volume"] = {"value": round(vol_ratio, 1), "signal": "HIGH VOLUME", "score": 10}
-        score_parts.append(10)
-    elif vol_ratio < 0.5:
-        signals["Volume"] = {"value": round(vol_ratio, 1), "signal": "LOW VOLUME", "score": -5}
-        score_parts.append(-5)
-    else:
-        signals["Volume"] = {"value": round(vol_ratio, 1), "signal": "NORMAL", "score": 0}
-        score_parts.append(0)
+    conds = [vol_ratio > 2.0, vol_ratio < 0.5]
+    score = int(np.select(conds, [10, -5], default=0))
+    label = str(np.select(conds, ["HIGH VOLUME", "LOW VOLUME"], default="NORMAL"))
+    signals["Volume"] = {"value": round(vol_ratio, 1), "signal": label, "score": score}
+    score_parts.append(score)
 
     # Stochastic
     stoch_k = last.get("Stoch_K", 50)
-    if stoch_k < 20:
-        signals["Stochastic"] = {"value": round(stoch_k, 1), "signal": "OVERSOLD", "score": 15}
-        score_parts.append(15)
-    elif stoch_k > 80:
-        signals["Stochastic"] = {"value": round(stoch_k, 1), "signal": "OVERBOUGHT", "score": -15}
-        score_parts.append(-15)
-    else:
-        signals["Stochastic"] = {"value": round(stoch_k, 1), "signal": "NEUTRAL", "score": 0}
-        score_parts.append(0)
+    conds = [stoch_k < 20, stoch_k > 80]
+    score = int(np.select(conds, [15, -15], default=0))
+    label = str(np.select(conds, ["OVERSOLD", "OVERBOUGHT"], default="NEUTRAL"))
+    signals["Stochastic"] = {"value": round(stoch_k, 1), "signal": label, "score": score}
+    score_parts.append(score)
 
     # ADX — trend strength
     adx = last.get("ADX", 20)
     if not np.isnan(adx):
-        if adx > 40:
-            signals["ADX"] = {"value": round(adx, 1), "signal": "STRONG TREND", "score": 10}
-            score_parts.append(10)
-        elif adx < 20:
-            signals["ADX"] = {"value": round(adx, 1), "signal": "NO TREND", "score": -5}
-            score_parts.append(-5)
-        else:
-            signals["ADX"] = {"value": round(adx, 1), "signal": "MODERATE", "score": 0}
-            score_parts.append(0)
+        conds = [adx > 40, adx < 20]
+        score = int(np.select(conds, [10, -5], default=0))
+        label = str(np.select(conds, ["STRONG TREND", "NO TREND"], default="MODERATE"))
+        signals["ADX"] = {"value": round(adx, 1), "signal": label, "score": score}
+        score_parts.append(score)
 
     # MFI — money flow
     mfi = last.get("MFI", 50)
     if not np.isnan(mfi):
-        if mfi < 20:
-            signals["MFI"] = {"value": round(mfi, 1), "signal": "OVERSOLD", "score": 15}
-            score_parts.append(15)
-        elif mfi > 80:
-            signals["MFI"] = {"value": round(mfi, 1), "signal": "OVERBOUGHT", "score": -15}
-            score_parts.append(-15)
-        else:
-            signals["MFI"] = {"value": round(mfi, 1), "signal": "NEUTRAL", "score": 0}
-            score_parts.append(0)
+        conds = [mfi < 20, mfi > 80]
+        score = int(np.select(conds, [15, -15], default=0))
+        label = str(np.select(conds, ["OVERSOLD", "OVERBOUGHT"], default="NEUTRAL"))
+        signals["MFI"] = {"value": round(mfi, 1), "signal": label, "score": score}
+        score_parts.append(score)
 
     # Aggregate score, clamped to [-100, 100]
     raw = sum(score_parts)
@@ -6,8 +6,11 @@ Uses GradientBoosting or RandomForest to predict next-day price direction.
 import os
 import pickle
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 
+import joblib
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
@@ -43,6 +46,35 @@ def _get_meta_path(ticker):
     return os.path.join(config.MODELS_DIR, f"{ticker.upper()}_meta.pkl")
 
 
+@lru_cache(maxsize=128)
+def _load_artifacts(ticker, model_mtime, scaler_mtime):
+    """Load (model, scaler, features) for a ticker, memoized in-process.
+
+    The mtimes key the cache, so a retrain (new file on disk) naturally
+    invalidates the stale entry while warm predict() calls skip the
+    unpickling entirely.
+    """
+    model = joblib.load(_get_model_path(ticker))
+    scaler = joblib.load(_get_scaler_path(ticker))
+    meta_path = _get_meta_path(ticker)
+    if os.path.exists(meta_path):
+        with open(meta_path, "rb") as f:
+            meta = pickle.load(f)
+        features = meta.get("features", FEATURE_COLS)
+    else:
+        features = FEATURE_COLS
+    return model, scaler, features
+
+
+@lru_cache(maxsize=32)
+def _select_features(model_features, columns):
+    """Intersect a model's feature list with a frame's columns, keeping
+    model order. Both sides arrive as tuples so repeat predict() calls
+    for the same model/frame shape hit the cache."""
+    present = set(columns)
+    return [c for c in model_features if c in present]
+
+
 def prepare_features(df):
     """Prepare feature matrix from a DataFrame with indicators computed."""
     if df.empty:
@@ -52,22 +84,24 @@ def prepare_features(df):
     if "RSI" not in df.columns:
         df = indicators.compute_all(df)
 
-    df = df.copy()
-
-    # Extra engineered features
-    df["Return_1d"] = df["Close"].pct_change(1)
-    df["Return_5d"] = df["Close"].pct_change(5)
-    df["Volatility_10"] = df["Close"].pct_change().rolling(10).std()
-    df["Volatility_20"] = df["Close"].pct_change().rolling(20).std()
+    # Extra engineered features — built as a separate frame and joined
+    # in one concat, so the caller's OHLCV block is never duplicated
+    returns = df["Close"].pct_change()
+    df = pd.concat([df, pd.DataFrame({
+        "Return_1d": returns,
+        "Return_5d": df["Close"].pct_change(5),
+        "Volatility_10": returns.rolling(10).std(),
+        "Volatility_20": returns.rolling(20).std(),
+    }, index=df.index)], axis=1)
 
     # Target: next-day direction (1 = up, 0 = down)
-    df["Future_Return"] = df["Close"].shift(-1) / df["Close"] - 1
-    df["Target"] = (df["Future_Return"] > 0).astype(int)
+    future_return = df["Close"].shift(-1) / df["Close"] - 1
+    target = (future_return > 0).astype(np.int8)
 
-    # Select features and drop NaN
+    # Select features and drop NaN; float32 is all the tree models use
+    # internally and it halves the matrix's memory traffic
     available_features = [c for c in FEATURE_COLS if c in df.columns]
-    feature_df = df[available_features].copy()
-    target = df["Target"].copy()
+    feature_df = df[available_features].astype(np.float32)
 
     # Drop rows with NaN
     mask = feature_df.notna().all(axis=1) & target.notna()
@@ -89,8 +123,9 @@ def train_model(ticker, df=None):
         log.warning(f"Not enough data to train {ticker} ({len(df)} samples)")
         return None
 
-    # Compute all indicators
-    df = indicators.compute_all(df)
+    # Compute all indicators unless already present
+    if "RSI" not in df.columns:
+        df = indicators.compute_all_cached(df, ticker)
 
     # Prepare features
     X, y = prepare_features(df)
@@ -101,9 +136,10 @@ def train_model(ticker, df=None):
 
     available_features = list(X.columns)
 
-    # Scale features
+    # Scale features — fit on the raw ndarray so the scaler carries no
+    # feature names and predict() can hand it plain arrays silently
     scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+    X_scaled = scaler.fit_transform(X.to_numpy()).astype(np.float32, copy=False)
 
     # Select model type
     if config.MODEL_TYPE == "random_forest":
@@ -119,8 +155,12 @@ def train_model(ticker, df=None):
         )
 
     # Time-series aware cross-validation
+    # n_jobs=-1 fans the folds out across cores (GBM has no n_jobs of
+    # its own); joblib caps nested workers when this already runs inside
+    # a retrain_all worker process.
     tscv = TimeSeriesSplit(n_splits=5)
-    cv_scores = cross_val_score(model, X_scaled, y, cv=tscv, scoring="accuracy")
+    cv_scores = cross_val_score(model, X_scaled, y, cv=tscv, scoring="accuracy",
+                                n_jobs=-1)
     log.info(f"{ticker} CV Accuracy: {cv_scores.mean():.3f} ± {cv_scores.std():.3f}")
 
     # Hold-out test: last 20% of samples (respecting time order)
@@ -155,12 +195,12 @@ def train_model(ticker, df=None):
         "feature_importances": importances,
     }
 
-    # Save model, scaler, and metadata
+    # Save model, scaler, and metadata — joblib streams the numpy-heavy
+    # sklearn payloads instead of pickling them buffer-by-buffer, and
+    # compress=3 keeps the per-ticker files small on disk.
     os.makedirs(config.MODELS_DIR, exist_ok=True)
-    with open(_get_model_path(ticker), "wb") as f:
-        pickle.dump(model, f)
-    with open(_get_scaler_path(ticker), "wb") as f:
-        pickle.dump(scaler, f)
+    joblib.dump(model, _get_model_path(ticker), compress=3)
+    joblib.dump(scaler, _get_scaler_path(ticker), compress=3)
     with open(_get_meta_path(ticker), "wb") as f:
         pickle.dump({"features": available_features}, f)
 
@@ -178,7 +218,6 @@ def predict(ticker, df=None):
     """Make a prediction for a ticker. Returns prediction dict."""
     model_path = _get_model_path(ticker)
     scaler_path = _get_scaler_path(ticker)
-    meta_path = _get_meta_path(ticker)
 
     # Load or train model
     if not os.path.exists(model_path):
@@ -188,17 +227,9 @@ def predict(ticker, df=None):
             return {"direction": "NEUTRAL", "confidence": 0.0, "change_pct": 0.0}
 
     try:
-        with open(model_path, "rb") as f:
-            model = pickle.load(f)
-        with open(scaler_path, "rb") as f:
-            scaler = pickle.load(f)
-        # Load saved feature list to ensure consistency
-        if os.path.exists(meta_path):
-            with open(meta_path, "rb") as f:
-                meta = pickle.load(f)
-            model_features = meta.get("features", FEATURE_COLS)
-        else:
-            model_features = FEATURE_COLS
+        model, scaler, model_features = _load_artifacts(
+            ticker, os.path.getmtime(model_path), os.path.getmtime(scaler_path)
+        )
     except Exception as e:
         log.error(f"Failed to load model for {ticker}: {e}")
         return {"direction": "NEUTRAL", "confidence": 0.0, "change_pct": 0.0}
@@ -211,24 +242,32 @@ def predict(ticker, df=None):
     if df.empty:
         return {"direction": "NEUTRAL", "confidence": 0.0, "change_pct": 0.0}
 
-    # Compute indicators + engineered features
-    df = indicators.compute_all(df)
-    df = df.copy()
-    df["Return_1d"] = df["Close"].pct_change(1)
-    df["Return_5d"] = df["Close"].pct_change(5)
-    df["Volatility_10"] = df["Close"].pct_change().rolling(10).std()
-    df["Volatility_20"] = df["Close"].pct_change().rolling(20).std()
-
-    # Use the exact features the model was trained on
-    available_features = [c for c in model_features if c in df.columns]
-    last_row = df[available_features].iloc[-1:]
-
-    if last_row.isna().any(axis=1).iloc[0]:
+    # Compute indicators + engineered features (skip when the caller
+    # already ran compute_all — same guard as prepare_features)
+    if "RSI" not in df.columns:
+        df = indicators.compute_all_cached(df, ticker)
+    returns = df["Close"].pct_change()
+    df = pd.concat([df, pd.DataFrame({
+        "Return_1d": returns,
+        "Return_5d": df["Close"].pct_change(5),
+        "Volatility_10": returns.rolling(10).std(),
+        "Volatility_20": returns.rolling(20).std(),
+    }, index=df.index)], axis=1)
+
+    # Use the exact features the model was trained on; the last row goes
+    # straight into an ndarray — no 1-row DataFrame round-trip
+    available_features = _select_features(tuple(model_features), tuple(df.columns))
+    row = np.fromiter(
+        (df[c].iat[-1] for c in available_features),
+        dtype=np.float32, count=len(available_features),
+    ).reshape(1, -1)
+
+    if np.isnan(row).any():
         log.warning(f"NaN in features for {ticker}")
         return {"direction": "NEUTRAL", "confidence": 0.0, "change_pct": 0.0}
 
     # Scale and predict
-    X_scaled = scaler.transform(last_row)
+    X_scaled = scaler.transform(row)
     prediction = model.predict(X_scaled)[0]
     probabilities = model.predict_proba(X_scaled)[0]
 
@@ -271,15 +310,26 @@ def get_ml_score(ticker, df=None):
 
 
 def retrain_all():
-    """Retrain models for all watchlist tickers."""
+    """Retrain models for all watchlist tickers.
+
+    GBM fitting is CPU-bound and holds the GIL, so tickers train in
+    worker processes — three of them, leaving one core for Flask.
+    The initializer drops the connection pool the fork inherited (a
+    SQLite connection must not cross fork()), so each worker opens its
+    own fresh connections; WAL handles the concurrent metric writes.
+    """
     watchlist = database.get_watchlist()
+    tickers = [item["ticker"] for item in watchlist]
     results = {}
-    for item in watchlist:
-        ticker = item["ticker"]
-        try:
-            metrics = train_model(ticker)
-            results[ticker] = metrics or {"status": "insufficient_data"}
-        except Exception as e:
-            results[ticker] = {"status": "error", "error": str(e)}
-            log.error(f"Failed to retrain {ticker}: {e}")
+    with ProcessPoolExecutor(max_workers=3,
+                             initializer=database.reset_pool) as ex:
+        futures = {ex.submit(train_model, t): t for t in tickers}
+        for fut in as_completed(futures):
+            ticker = futures[fut]
+            try:
+                metrics = fut.result()
+                results[ticker] = metrics or {"status": "insufficient_data"}
+            except Exception as e:
+                results[ticker] = {"status": "error", "error": str(e)}
+                log.error(f"Failed to retrain {ticker}: {e}")
     return results
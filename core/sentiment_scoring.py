@@ -8,7 +8,11 @@ while keyword matching carries most of the weight — especially for
 German-language headlines from Yahoo Finance DE RSS feeds.
 """
 import re
-from textblob import TextBlob
+
+import numpy as np
+from textblob.sentiments import PatternAnalyzer
+
+from core._njit import NUMBA_AVAILABLE
 
 # ── Financial keyword lists (English + German) ──────────
 _BULLISH = [
@@ -67,6 +71,54 @@ _KEYWORD_BOOST = 0.12
 _TEXTBLOB_WEIGHT = 0.3
 
 
+def _combine_py(bull, bear, base):
+    """Blend keyword hits and base polarity into [-1, 1]. Works
+    elementwise on arrays and on scalars."""
+    combined = (bull - bear) * _KEYWORD_BOOST + base * _TEXTBLOB_WEIGHT
+    return np.clip(combined, -1.0, 1.0)
+
+
+if NUMBA_AVAILABLE:
+    from numba import vectorize
+
+    @vectorize(["float64(int64, int64, float64)"], nopython=True)
+    def _combine(bull, bear, base):
+        combined = (bull - bear) * _KEYWORD_BOOST + base * _TEXTBLOB_WEIGHT
+        return min(1.0, max(-1.0, combined))
+else:
+    _combine = _combine_py
+
+
+# One analyzer for the process: constructing TextBlob per headline pays
+# for a tokenizer and a fresh PatternAnalyzer each call, and none of
+# that is needed just to read a polarity off a string.
+_PATTERN = PatternAnalyzer()
+
+
+def _base_polarity(text: str) -> float:
+    """Pattern polarity — useful for English, near-zero for German."""
+    try:
+        return float(_PATTERN.analyze(text).polarity)
+    except Exception:
+        return 0.0
+
+
+def analyze_texts(texts) -> np.ndarray:
+    """Score many texts in one pass, returning polarities in [-1.0, 1.0].
+
+    Keyword hits are gathered into int64 arrays and blended with the
+    TextBlob base polarity by a single ufunc call (a C loop under numba,
+    np.clip arithmetic otherwise) instead of per-headline Python math.
+    """
+    n = len(texts)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    bull = np.fromiter((len(_BULL_RE.findall(t)) for t in texts), dtype=np.int64, count=n)
+    bear = np.fromiter((len(_BEAR_RE.findall(t)) for t in texts), dtype=np.int64, count=n)
+    base = np.fromiter((_base_polarity(t) for t in texts), dtype=np.float64, count=n)
+    return np.asarray(_combine(bull, bear, base), dtype=np.float64)
+
+
 def analyze_text(text: str) -> float:
     """Return a sentiment polarity in [-1.0, 1.0].
 
@@ -77,21 +129,11 @@ def analyze_text(text: str) -> float:
     if not text:
         return 0.0
 
-    # TextBlob base — useful for English, near-zero for German
-    try:
-        base = float(TextBlob(text).sentiment.polarity)
-    except Exception:
-        base = 0.0
-
-    # Keyword matching — the main signal for German headlines
+    # Keyword matching is the main signal for German headlines;
+    # TextBlob polarity is blended in as a minor factor.
     bull_hits = len(_BULL_RE.findall(text))
     bear_hits = len(_BEAR_RE.findall(text))
-    keyword_score = (bull_hits - bear_hits) * _KEYWORD_BOOST
-
-    # Blend: keywords dominate, TextBlob is secondary
-    combined = keyword_score + (base * _TEXTBLOB_WEIGHT)
-
-    return max(-1.0, min(1.0, combined))
+    return float(_combine(bull_hits, bear_hits, _base_polarity(text)))
 
 
 def score_label(score: float) -> str:
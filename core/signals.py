@@ -3,6 +3,9 @@ FinEdge - Signal Generator
 Combines ML predictions, technical analysis, and sentiment into an Edge Score.
 """
 import logging
+import os
+from bisect import bisect
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 import config
@@ -12,27 +15,25 @@ from services.sentiment_service import get_sentiment_score
 
 log = logging.getLogger("finedge.signals")
 
-SIGNAL_LABELS = {
-    (60, 100): "STRONG BUY",
-    (25, 60): "BUY",
-    (-25, 25): "HOLD",
-    (-60, -25): "SELL",
-    (-100, -60): "STRONG SELL",
-}
+# Bucket upper bounds (inclusive) and their labels: scores at a
+# boundary keep the milder bucket, matching the old range table.
+_THRESHOLDS = (-60, -25, 25, 60)
+_LABELS = ("STRONG SELL", "SELL", "HOLD", "BUY", "STRONG BUY")
 
 
 def classify_signal(score: float) -> str:
     """Classify an edge score into a signal label."""
-    for (lo, hi), label in SIGNAL_LABELS.items():
-        if lo <= score <= hi:
-            return label
-    return "HOLD"
+    return _LABELS[bisect(_THRESHOLDS, score)]
 
 
-def generate_signal(ticker: str):
+def generate_signal(ticker: str, save: bool = True):
     """
     Generate a complete trading signal for a ticker.
     Combines ML + Technical + Sentiment into a single Edge Score.
+
+    With save=False the signal is not persisted — callers batching a
+    whole watchlist collect the results and flush them in one
+    transaction via database.save_signals_bulk.
     """
     ticker = ticker.upper().strip()
     log.info(f"Generating signal for {ticker}...")
@@ -45,8 +46,8 @@ def generate_signal(ticker: str):
         log.warning(f"No data available for {ticker}")
         return None
 
-    # Compute indicators
-    df_with_indicators = indicators.compute_all(df)
+    # Compute indicators (memoized per ticker until a new bar lands)
+    df_with_indicators = indicators.compute_all_cached(df, ticker)
 
     # ── ML Score ──────────────────────────────────────────
     try:
@@ -93,10 +94,11 @@ def generate_signal(ticker: str):
     }
 
     # Save to database
-    database.save_signal(
-        ticker, signal_type, edge_score,
-        ml_score, ta_score, sent_score, details
-    )
+    if save:
+        database.save_signal(
+            ticker, signal_type, edge_score,
+            ml_score, ta_score, sent_score, details
+        )
 
     log.info(f"Signal for {ticker}: {signal_type} (Edge: {edge_score})")
 
@@ -112,26 +114,43 @@ def generate_signal(ticker: str):
 
 
 def generate_all_signals():
-    """Generate signals for all watchlist tickers."""
+    """Generate signals for all watchlist tickers.
+
+    Tickers run concurrently in a thread pool: the per-ticker work is a
+    mix of network waits (news feeds) and sklearn tree prediction, which
+    releases the GIL — so threads overlap it without pickling overhead.
+    """
     watchlist = database.get_watchlist()
+    tickers = [t for t in
+               ((item.get("ticker") or "").upper().strip() for item in watchlist)
+               if t]
     results = []
 
-    for item in watchlist:
-        t = (item.get("ticker") or "").upper().strip()
-        if not t:
-            continue
-        try:
-            sig = generate_signal(t)
-            if sig:
-                results.append(sig)
-        except Exception as e:
-            log.error(f"Signal generation failed for {t}: {e}")
-            results.append({
-                "ticker": t,
-                "signal": "ERROR",
-                "edge_score": 0,
-                "error": str(e)
-            })
+    rows = []
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 4)) as ex:
+        futures = {ex.submit(generate_signal, t, False): t for t in tickers}
+        for fut in as_completed(futures):
+            t = futures[fut]
+            try:
+                sig = fut.result()
+                if sig:
+                    results.append(sig)
+                    rows.append((
+                        sig["ticker"], sig["signal"], sig["edge_score"],
+                        sig["ml_score"], sig["ta_score"], sig["sentiment_score"],
+                        sig["details"],
+                    ))
+            except Exception as e:
+                log.error(f"Signal generation failed for {t}: {e}")
+                results.append({
+                    "ticker": t,
+                    "signal": "ERROR",
+                    "edge_score": 0,
+                    "error": str(e)
+                })
+
+    # One transaction for the whole cycle instead of a commit per ticker
+    database.save_signals_bulk(rows)
 
     return sorted(results, key=lambda x: x.get("edge_score", 0), reverse=True)
 
@@ -8,12 +8,27 @@ import time
 from typing import Optional, Dict, Any
 
 import pandas as pd
+import requests
 import yfinance as yf
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
 log = logging.getLogger("finedge.providers.market_yahoo")
 
+# One pooled session for all Yahoo traffic: keep-alive amortizes the TLS
+# handshake across tickers, and the Retry policy backs off on Yahoo's
+# 429/5xx responses instead of silently returning empty frames.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
 
 def _flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
@@ -37,27 +52,38 @@ def _retry(fn, *args, retries: int = 3, base_sleep: float = 0.6, **kwargs):
     raise last_err
 
 
+def _fast_attr(fi, name, default=0):
+    """fast_info attributes raise individually when Yahoo omits a field."""
+    try:
+        val = getattr(fi, name)
+        return val if val is not None else default
+    except Exception:
+        return default
+
+
 def get_ticker_info(symbol: str) -> Dict[str, Any]:
     """
-    Fetch basic quote/info (best-effort). Yahoo info can be flaky.
+    Fetch basic quote data via fast_info — one JSON endpoint instead of
+    the multi-request HTML scrape behind `.info` (often 2-5s per call).
+    name/sector/pe come from the slower get_ticker_profile.
     """
     symbol = symbol.upper().strip()
     try:
-        t = yf.Ticker(symbol)
-        info = _retry(lambda: (t.info or {}))
+        t = yf.Ticker(symbol, session=_SESSION)
+        fi = _retry(lambda: t.fast_info)
         return {
             "ticker": symbol,
-            "name": info.get("shortName", info.get("longName", symbol)),
-            "price": info.get("regularMarketPrice", info.get("currentPrice", 0)) or 0,
-            "prev_close": info.get("previousClose", 0) or 0,
-            "market_cap": info.get("marketCap", 0) or 0,
-            "volume": info.get("regularMarketVolume", info.get("volume", 0)) or 0,
-            "day_high": info.get("dayHigh", 0) or 0,
-            "day_low": info.get("dayLow", 0) or 0,
-            "52w_high": info.get("fiftyTwoWeekHigh", 0) or 0,
-            "52w_low": info.get("fiftyTwoWeekLow", 0) or 0,
-            "pe_ratio": info.get("trailingPE", 0) or 0,
-            "sector": info.get("sector", "N/A"),
+            "name": symbol,
+            "price": _fast_attr(fi, "last_price"),
+            "prev_close": _fast_attr(fi, "previous_close"),
+            "market_cap": _fast_attr(fi, "market_cap"),
+            "volume": _fast_attr(fi, "last_volume"),
+            "day_high": _fast_attr(fi, "day_high"),
+            "day_low": _fast_attr(fi, "day_low"),
+            "52w_high": _fast_attr(fi, "year_high"),
+            "52w_low": _fast_attr(fi, "year_low"),
+            "pe_ratio": 0,
+            "sector": "N/A",
             "asset_type": "crypto" if "-USD" in symbol else "stock",
         }
     except Exception as e:
@@ -65,18 +91,44 @@ def get_ticker_info(symbol: str) -> Dict[str, Any]:
         return {"ticker": symbol, "name": symbol, "price": 0, "error": str(e)}
 
 
-def get_history(symbol: str, period: Optional[str] = None, interval: str = "1d") -> pd.DataFrame:
+def get_ticker_profile(symbol: str) -> Dict[str, Any]:
+    """
+    Fetch the slow descriptive fields (name/sector/pe) via `.info`.
+    Best-effort; meant to run off the request path.
+    """
+    symbol = symbol.upper().strip()
+    try:
+        t = yf.Ticker(symbol, session=_SESSION)
+        info = _retry(lambda: (t.info or {}))
+        return {
+            "name": info.get("shortName", info.get("longName", symbol)),
+            "sector": info.get("sector", "N/A"),
+            "pe_ratio": info.get("trailingPE", 0) or 0,
+        }
+    except Exception as e:
+        log.warning(f"Failed to fetch profile for {symbol}: {e}")
+        return {}
+
+
+def get_history(symbol: str, period: Optional[str] = None, interval: str = "1d",
+                start: Optional[str] = None) -> pd.DataFrame:
     """
     Fetch OHLCV history from Yahoo.
+    With `start` ('YYYY-MM-DD'), fetches from that date instead of a
+    trailing period — used for incremental top-ups.
     """
     symbol = symbol.upper().strip()
     period = period or config.HISTORY_PERIOD
     try:
-        t = yf.Ticker(symbol)
-        df = _retry(lambda: t.history(period=period, interval=interval, auto_adjust=False))
+        t = yf.Ticker(symbol, session=_SESSION)
+        if start:
+            df = _retry(lambda: t.history(start=start, interval=interval, auto_adjust=False))
+        else:
+            df = _retry(lambda: t.history(period=period, interval=interval, auto_adjust=False))
         df = _flatten_columns(df)
         if df.empty:
-            log.warning(f"No history data for {symbol} (period={period}, interval={interval})")
+            if not start:
+                log.warning(f"No history data for {symbol} (period={period}, interval={interval})")
             return pd.DataFrame()
         return df
     except Exception as e:
@@ -84,13 +136,55 @@ def get_history(symbol: str, period: Optional[str] = None, interval: str = "1d")
         return pd.DataFrame()
 
 
+def get_history_bulk(symbols, period: Optional[str] = None, interval: str = "1d") -> Dict[str, pd.DataFrame]:
+    """
+    Fetch OHLCV history for many symbols in one yf.download call.
+    yfinance batches tickers per HTTP request internally, so this costs
+    a handful of round-trips instead of one per symbol.
+    Returns {symbol: DataFrame}; symbols with no data are omitted.
+    """
+    symbols = [s.upper().strip() for s in symbols if s and s.strip()]
+    if not symbols:
+        return {}
+    period = period or config.HISTORY_PERIOD
+    try:
+        data = _retry(lambda: yf.download(
+            tickers=" ".join(symbols), period=period, interval=interval,
+            group_by="ticker", threads=True, auto_adjust=False, progress=False,
+            session=_SESSION,
+        ))
+    except Exception as e:
+        log.error(f"Bulk history download failed for {len(symbols)} symbols: {e}")
+        return {}
+
+    if data is None or data.empty:
+        return {}
+
+    result: Dict[str, pd.DataFrame] = {}
+    if len(symbols) == 1:
+        df = _flatten_columns(data).dropna(how="all")
+        if not df.empty:
+            result[symbols[0]] = df
+        return result
+
+    for symbol in symbols:
+        try:
+            df = data[symbol].dropna(how="all")
+        except KeyError:
+            log.warning(f"No history data for {symbol} in bulk download (period={period})")
+            continue
+        if not df.empty:
+            result[symbol] = df
+    return result
+
+
 def get_latest_price(symbol: str, period: str = "5d") -> Optional[Dict[str, Any]]:
     """
     Fetch latest candle and compute day change vs previous candle.
     """
     symbol = symbol.upper().strip()
     try:
-        t = yf.Ticker(symbol)
+        t = yf.Ticker(symbol, session=_SESSION)
         df = _retry(lambda: t.history(period=period, auto_adjust=False))
         df = _flatten_columns(df)
         if df.empty:
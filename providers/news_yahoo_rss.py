@@ -4,7 +4,8 @@ External I/O only: fetches RSS feeds, returns list of articles.
 No scoring and no DB writes here.
 """
 import logging
-from typing import List, Dict, Any, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set
 
 import feedparser
 
@@ -13,32 +14,50 @@ import config
 log = logging.getLogger("finedge.providers.news_yahoo_rss")
 
 
+def _fetch_feed(url: str):
+    """Fetch and parse one feed; errors become None so a dead source
+    doesn't take the whole batch down."""
+    try:
+        return feedparser.parse(url)
+    except Exception as e:
+        log.error(f"Failed to fetch news feed {url}: {e}")
+        return None
+
+
 def get_news(symbol: str) -> List[Dict[str, Any]]:
     symbol = symbol.upper().strip()
     headlines: List[Dict[str, Any]] = []
     seen_links: Set[str] = set()
 
-    for url_template in config.NEWS_SOURCES:
-        url = url_template.format(ticker=symbol)
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[: config.MAX_NEWS_ITEMS]:
-                link = entry.get("link", "") or ""
-                title = entry.get("title", "") or ""
-                if link and link in seen_links:
-                    continue
-                if link:
-                    seen_links.add(link)
-                headlines.append(
-                    {
-                        "title": title,
-                        "link": link,
-                        "published": entry.get("published", "") or "",
-                        "summary": (entry.get("summary", "") or "")[:200],
-                        "source_url": url,
-                    }
-                )
-        except Exception as e:
-            log.error(f"Failed to fetch news for {symbol} from {url}: {e}")
-
-    return headlines
\ No newline at end of file
+    urls = [tpl.format(ticker=symbol) for tpl in config.NEWS_SOURCES]
+    if not urls:
+        return headlines
+
+    # Each parse is a blocking HTTP GET plus XML parse; fetching the
+    # sources concurrently collapses the round-trips to the slowest one.
+    # ex.map keeps source order, so dedup behaves as in the serial loop.
+    feeds: List[Optional[Any]]
+    with ThreadPoolExecutor(max_workers=len(urls)) as ex:
+        feeds = list(ex.map(_fetch_feed, urls))
+
+    for url, feed in zip(urls, feeds):
+        if feed is None:
+            continue
+        for entry in feed.entries[: config.MAX_NEWS_ITEMS]:
+            link = entry.get("link", "") or ""
+            title = entry.get("title", "") or ""
+            if link and link in seen_links:
+                continue
+            if link:
+                seen_links.add(link)
+            headlines.append(
+                {
+                    "title": title,
+                    "link": link,
+                    "published": entry.get("published", "") or "",
+                    "summary": (entry.get("summary", "") or "")[:200],
+                    "source_url": url,
+                }
+            )
+
+    return headlines
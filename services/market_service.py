@@ -4,7 +4,11 @@ Market service: orchestrates provider + DB.
 - Incremental-ish refresh policy
 """
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
 
 import pandas as pd
 
@@ -14,16 +18,43 @@ from providers import market_yahoo
 
 log = logging.getLogger("finedge.services.market")
 
+# Short-TTL caches: the dashboard polls the same tickers from several
+# widgets within seconds, so repeat hits become dict lookups instead of
+# Yahoo round-trips. Guarded by a lock since Flask runs threaded=True.
+_PRICE_TTL = 60     # seconds
+_INFO_TTL = 600     # seconds
+_cache_lock = threading.Lock()
+_price_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 def update_history(symbol: str, period: Optional[str] = None, interval: str = "1d") -> pd.DataFrame:
     """
     Fetch history from provider and store to DB.
+
+    When the DB already has recent bars for the symbol, only the missing
+    tail is fetched (start=last stored date) — roughly one row instead
+    of a full period. A weekend/after-hours run may return an empty
+    frame; that's a fast no-op.
     """
     symbol = symbol.upper().strip()
-    df = market_yahoo.get_history(symbol, period=period, interval=interval)
+    start = None
+    if interval == "1d":
+        last_date = database.get_last_date(symbol)
+        if last_date:
+            try:
+                age = datetime.now() - datetime.strptime(last_date, "%Y-%m-%d")
+                if age <= timedelta(days=7):
+                    start = last_date
+            except ValueError:
+                pass
+    df = market_yahoo.get_history(symbol, period=period, interval=interval, start=start)
     if df.empty:
         return df
     database.save_prices(symbol, df)
+    # New bars invalidate the cached latest price
+    with _cache_lock:
+        _price_cache.pop(symbol, None)
     return df
 
 
@@ -32,55 +63,123 @@ def get_history_df(symbol: str, days: int = 365, fallback_period: Optional[str]
     Read from DB; if missing, fetch from provider, store, return.
     """
     symbol = symbol.upper().strip()
-    prices = database.get_prices(symbol, limit=days)
-    if not prices:
+    df = database.get_prices_df(symbol, limit=days)
+    if df.empty:
         df = update_history(symbol, period=fallback_period or config.HISTORY_PERIOD)
         return df if not df.empty else pd.DataFrame()
-
-    df = pd.DataFrame(prices)
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.set_index("date")
-    df = df.rename(
-        columns={
-            "open": "Open",
-            "high": "High",
-            "low": "Low",
-            "close": "Close",
-            "volume": "Volume",
-            "adj_close": "Adj Close",
-        }
-    )
     return df
 
 
 def get_latest_price(symbol: str) -> Optional[Dict[str, Any]]:
     """
-    Latest price from provider (simple). Optionally you could cache in DB.
+    Latest price from provider, cached in-memory for _PRICE_TTL seconds.
     """
     symbol = symbol.upper().strip()
-    return market_yahoo.get_latest_price(symbol)
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _price_cache.get(symbol)
+        if hit and now - hit[0] < _PRICE_TTL:
+            return hit[1]
+    result = market_yahoo.get_latest_price(symbol)
+    if result:
+        with _cache_lock:
+            _price_cache[symbol] = (now, result)
+    return result
+
+
+def _fill_profile(symbol: str, record: Dict[str, Any]) -> None:
+    """Merge the slow name/sector/pe fields into an info record off the
+    request path; later cache hits see the completed record."""
+    profile = market_yahoo.get_ticker_profile(symbol)
+    if profile:
+        with _cache_lock:
+            record.update(profile)
+
+
+def get_ticker_profile(symbol: str) -> Dict[str, Any]:
+    """Descriptive fields (name/sector/pe), fetched synchronously.
+
+    For one-off paths that persist the name — adding a ticker to the
+    watchlist — waiting on the slow `.info` scrape is fine; the async
+    backfill only reaches the in-memory cache, never the DB row. Merges
+    into the cached info record so later get_ticker_info hits see it.
+    """
+    symbol = symbol.upper().strip()
+    profile = market_yahoo.get_ticker_profile(symbol) or {}
+    if profile:
+        with _cache_lock:
+            hit = _info_cache.get(symbol)
+            if hit:
+                hit[1].update(profile)
+    return profile
+
+
+def get_ticker_info(symbol: str) -> Dict[str, Any]:
+    """
+    Ticker info from provider, cached in-memory for _INFO_TTL seconds
+    (info changes rarely and is the slowest provider call).
+
+    Returns the fast quote fields immediately; the descriptive fields
+    (name/sector/pe) are filled into the cached record by a background
+    thread so the caller never blocks on Yahoo's slow `.info` scrape.
+    """
+    symbol = symbol.upper().strip()
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _info_cache.get(symbol)
+        if hit and now - hit[0] < _INFO_TTL:
+            return hit[1]
+    result = market_yahoo.get_ticker_info(symbol)
+    if result and not result.get("error"):
+        with _cache_lock:
+            _info_cache[symbol] = (now, result)
+        threading.Thread(target=_fill_profile, args=(symbol, result), daemon=True).start()
+    return result
 
 
 def refresh_watchlist(mode: str = "refresh") -> Dict[str, Any]:
     """
     Refresh all tickers in watchlist.
 
+    History comes from one bulk provider download (a few HTTP round-trips
+    for the whole watchlist); ticker infos are fetched concurrently since
+    each is an independent blocking request.
+
     mode:
       - "refresh": fetch only recent data for speed (30d)
       - "full": fetch config.HISTORY_PERIOD (e.g., 1y)
     """
     watchlist = database.get_watchlist()
+    symbols = [item["ticker"].upper().strip() for item in watchlist if item.get("ticker")]
     results: Dict[str, Any] = {}
 
     # Use shorter period on scheduled refresh to reduce rate limits
     period = "30d" if mode == "refresh" else config.HISTORY_PERIOD
 
-    for item in watchlist:
-        symbol = item["ticker"].upper().strip()
+    histories = market_yahoo.get_history_bulk(symbols, period=period, interval="1d")
+
+    infos: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = {ex.submit(market_yahoo.get_ticker_info, s): s for s in symbols}
+        for fut in as_completed(futures):
+            symbol = futures[fut]
+            try:
+                infos[symbol] = fut.result()
+            except Exception as e:
+                infos[symbol] = {"error": str(e)}
+                log.error(f"Error fetching info for {symbol}: {e}")
+
+    for symbol in symbols:
         try:
-            info = market_yahoo.get_ticker_info(symbol)
-            df = update_history(symbol, period=period, interval="1d")
-            results[symbol] = {"info": info, "history_count": len(df), "status": "ok", "period_used": period}
+            df = histories.get(symbol, pd.DataFrame())
+            if not df.empty:
+                database.save_prices(symbol, df)
+            results[symbol] = {
+                "info": infos.get(symbol, {}),
+                "history_count": len(df),
+                "status": "ok",
+                "period_used": period,
+            }
         except Exception as e:
             results[symbol] = {"status": "error", "error": str(e)}
             log.error(f"Error refreshing {symbol}: {e}")
@@ -4,9 +4,12 @@ Sentiment service: orchestrates news provider + scoring + DB caching.
 import logging
 from typing import Tuple, List, Dict, Any
 
+import numpy as np
+
 import config
 from core import database
-from core.sentiment_scoring import analyze_text, score_label
+from core.cache import ttl_cache
+from core.sentiment_scoring import analyze_texts, score_label
 from providers.news_yahoo_rss import get_news
 
 log = logging.getLogger("finedge.services.sentiment")
@@ -23,29 +26,25 @@ def analyze_ticker(symbol: str) -> Tuple[float, List[Dict[str, Any]]]:
         log.info(f"No news found for {symbol}")
         return 0.0, []
 
-    analyzed: List[Dict[str, Any]] = []
-    scores: List[float] = []
-
-    for item in headlines:
-        text = f"{item.get('title','')}. {item.get('summary','')}"
-        s = analyze_text(text)
-        scores.append(s)
-        analyzed.append(
-            {
-                "title": item.get("title", ""),
-                "link": item.get("link", ""),
-                "published": item.get("published", ""),
-                "sentiment": round(s, 3),
-                "label": score_label(s),
-            }
-        )
-
-    # Weighted average (later entries get higher weight)
-    if scores:
-        weights = list(range(1, len(scores) + 1))
-        avg_score = sum(s * w for s, w in zip(scores, weights)) / sum(weights)
-    else:
-        avg_score = 0.0
+    texts = [f"{item.get('title','')}. {item.get('summary','')}" for item in headlines]
+    scores = analyze_texts(texts)
+
+    analyzed: List[Dict[str, Any]] = [
+        {
+            "title": item.get("title", ""),
+            "link": item.get("link", ""),
+            "published": item.get("published", ""),
+            "sentiment": round(float(s), 3),
+            "label": score_label(s),
+        }
+        for item, s in zip(headlines, scores)
+    ]
+
+    # Weighted average (later entries get higher weight): one dot
+    # product against 1..n, denominator in closed form
+    n = scores.size
+    weights = np.arange(1, n + 1, dtype=np.float64)
+    avg_score = float(scores @ weights / (n * (n + 1) / 2))
 
     database.save_sentiment(
         symbol,
@@ -57,6 +56,7 @@ def analyze_ticker(symbol: str) -> Tuple[float, List[Dict[str, Any]]]:
     return avg_score, analyzed
 
 
+@ttl_cache(seconds=300)
 def get_sentiment_score(symbol: str):
     avg_score, analyzed = analyze_ticker(symbol)
 
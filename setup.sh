@@ -13,7 +13,7 @@ SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 cd "$SCRIPT_DIR"
 
 # Check Python
-echo "[1/5] Checking Python..."
+echo "[1/6] Checking Python..."
 if ! command -v python3 &> /dev/null; then
     echo "ERROR: Python 3 not found. Please install Python 3.9 or newer from https://www.python.org/downloads/"
     exit 1
@@ -22,7 +22,7 @@ PYVER=$(python3 --version)
 echo "  Found: $PYVER"
 
 # Create virtual environment
-echo "[2/5] Setting up virtual environment..."
+echo "[2/6] Setting up virtual environment..."
 if [ ! -d "venv" ]; then
     python3 -m venv venv
     echo "  Created virtual environment"
@@ -32,20 +32,28 @@ fi
 source venv/bin/activate
 
 # Install dependencies
-echo "[3/5] Installing dependencies..."
+echo "[3/6] Installing dependencies..."
 pip install --upgrade pip setuptools wheel -q
 pip install -r requirements.txt -q
 
 # Download TextBlob data
-echo "[4/5] Downloading NLP data..."
+echo "[4/6] Downloading NLP data..."
 python3 -c "import textblob; textblob.download_corpora.download_all()" 2>/dev/null || \
 python3 -m textblob.download_corpora 2>/dev/null || \
 echo "  Note: TextBlob corpora download may require: python3 -m textblob.download_corpora"
 
 # Create directories
-echo "[5/5] Initializing data directories..."
+echo "[5/6] Initializing data directories..."
 mkdir -p data models
 
+# Pre-compile the numba indicator kernels so the service doesn't pay
+# JIT latency on its first start. cache=True kernels persist the
+# compiled code under data/_numba_cache; this just fills that cache now.
+echo "[6/6] Pre-compiling indicator kernels..."
+python3 -c "from core.indicators import prewarm_jit; prewarm_jit()" 2>/dev/null && \
+echo "  Kernels compiled and cached" || \
+echo "  Note: numba not installed; indicators will run the pandas fallback"
+
 echo ""
 echo "================================================"
 echo "  Setup Complete!"